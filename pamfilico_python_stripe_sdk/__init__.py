@@ -10,6 +10,7 @@ from pamfilico_python_stripe_sdk.models import (
     CustomerResponse,
     CustomerListResponse,
     CustomerListMeta,
+    is_valid_email,
 )
 from pamfilico_python_stripe_sdk.exceptions import (
     StripeSDKException,
@@ -27,6 +28,7 @@ __all__ = [
     "CustomerResponse",
     "CustomerListResponse",
     "CustomerListMeta",
+    "is_valid_email",
     "StripeSDKException",
     "StripeAuthenticationError",
     "StripeAPIError",
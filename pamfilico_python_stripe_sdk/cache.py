@@ -0,0 +1,63 @@
+"""In-process caching utilities for Stripe SDK responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+
+    Once ``maxsize`` entries are stored, the least recently used entry is
+    evicted to make room for a new one.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value, or default if not cached."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
@@ -1,13 +1,32 @@
 """Pydantic models for Stripe SDK responses."""
 
-from typing import Dict, Any, List
-from pydantic import BaseModel, Field, EmailStr
+import re
+from typing import Annotated, Dict, Any, List
+from pydantic import AfterValidator, BaseModel, Field
+
+# Shape check only (local@domain.tld); Stripe does the full validation
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def is_valid_email(value: str) -> bool:
+    """Return True if value has the shape of an email address (local@domain.tld)."""
+    return _EMAIL_RE.fullmatch(value) is not None
+
+
+def _check_email(value: str) -> str:
+    """Reject values that cannot be an email address; Stripe does the full check."""
+    if not is_valid_email(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+EmailAddress = Annotated[str, AfterValidator(_check_email)]
 
 
 class CustomerCreateInput(BaseModel):
     """Input model for creating a Stripe customer."""
 
-    email: EmailStr | None = Field(None, description="Customer email address")
+    email: EmailAddress | None = Field(None, description="Customer email address")
     name: str | None = Field(None, min_length=1, max_length=255, description="Customer name")
     phone: str | None = Field(None, description="Customer phone number")
     description: str | None = Field(None, max_length=500, description="Customer description")
@@ -17,7 +36,7 @@ class CustomerCreateInput(BaseModel):
 class CustomerUpdateInput(BaseModel):
     """Input model for updating a Stripe customer."""
 
-    email: EmailStr | None = Field(None, description="Updated customer email address")
+    email: EmailAddress | None = Field(None, description="Updated customer email address")
     name: str | None = Field(None, min_length=1, max_length=255, description="Updated customer name")
     phone: str | None = Field(None, description="Updated customer phone number")
     description: str | None = Field(None, max_length=500, description="Updated customer description")
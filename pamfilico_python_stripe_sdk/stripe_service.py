@@ -1,9 +1,16 @@
 """Stripe service for handling Stripe API operations."""
 
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
 import stripe
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, TypeAdapter
+from typing import Optional, Dict, Any, List, Hashable, Iterator, Type, TypeVar, Callable
 
+from pamfilico_python_stripe_sdk.cache import TTLCache
 from pamfilico_python_stripe_sdk.models import (
+    is_valid_email,
     CustomerResponse,
     CustomerListResponse,
     CustomerData,
@@ -12,11 +19,68 @@ from pamfilico_python_stripe_sdk.models import (
     CustomerUpdateInput,
 )
 from pamfilico_python_stripe_sdk.exceptions import (
+    StripeSDKException,
     StripeAuthenticationError,
     StripeAPIError,
     StripeInvalidRequestError,
+    StripeValidationError,
 )
 
+_ResponseT = TypeVar("_ResponseT", bound=BaseModel)
+_T = TypeVar("_T")
+
+# Built once at import; validates a whole page of customers inside pydantic-core
+_CUSTOMER_LIST_ADAPTER = TypeAdapter(List[CustomerData])
+
+
+def _serialize_customer(customer: stripe.Customer) -> CustomerData:
+    """Convert a Stripe customer object into a CustomerData model."""
+    # StripeObject is a dict subclass, so pydantic-core can read the fields
+    # straight from it; keys CustomerData does not declare are ignored.
+    return CustomerData.model_validate(customer)
+
+
+def _serialize_customer_list(
+    customers: List[stripe.Customer],
+    has_more: bool = False,
+    with_note: bool = False
+) -> CustomerListResponse:
+    """Convert Stripe customer objects into a CustomerListResponse.
+
+    Args:
+        customers: Stripe customer objects, in response order
+        has_more: Whether Stripe reported more results after this page
+        with_note: Add a "Found N customer(s)" note to the metadata
+    """
+    customers_data = _CUSTOMER_LIST_ADAPTER.validate_python(customers)
+
+    count = len(customers_data)
+    note = None
+    if with_note:
+        note = f"Found {count} customer" if count == 1 else f"Found {count} customers"
+
+    meta = CustomerListMeta(has_more=has_more, total_count=count, note=note)
+
+    return CustomerListResponse(data=customers_data, meta=meta)
+
+
+def _translate_stripe_error(error: stripe.error.StripeError) -> StripeSDKException:
+    """Map a Stripe SDK error onto the matching SDK exception."""
+    if isinstance(error, stripe.error.AuthenticationError):
+        return StripeAuthenticationError(
+            message=f"Stripe authentication failed: {str(error)}",
+            original_error=error
+        )
+    if isinstance(error, stripe.error.InvalidRequestError):
+        return StripeInvalidRequestError(
+            message=f"Invalid request to Stripe API: {str(error)}",
+            original_error=error
+        )
+    return StripeAPIError(
+        message=f"Stripe API error: {str(error)}",
+        original_error=error
+    )
+
 
 class StripeService:
     """Service class for Stripe operations.
@@ -25,12 +89,33 @@ class StripeService:
     Does not read from environment variables - keys must be provided explicitly.
     """
 
-    def __init__(self, secret_key: str, publishable_key: str):
+    def __init__(
+        self,
+        secret_key: str,
+        publishable_key: str,
+        customer_cache_size: int = 0,
+        customer_cache_ttl: float = 60.0,
+        max_network_retries: int = 2,
+        cache_dir: Optional[str] = None
+    ):
         """Initialize Stripe service with API keys.
 
         Args:
             secret_key: Stripe secret key (sk_test_... or sk_live_...)
             publishable_key: Stripe publishable key (pk_test_... or pk_live_...)
+            customer_cache_size: Maximum number of customers kept in the
+                get_customer cache (default: 0, disabled). Cached reads do
+                not see changes made outside this process until the TTL expires.
+            customer_cache_ttl: Seconds a cached customer stays valid (default: 60)
+            max_network_retries: Times a failed request is retried with
+                exponential backoff (default: 2, 0 disables retries)
+            cache_dir: Directory for an on-disk response cache used to replay
+                read calls in development and tests (default: None, disabled).
+                Requires the optional ``diskcache`` dependency. Entries never
+                expire: creating or updating a customer through this service
+                evicts cached email and list lookups (and that customer), but
+                changes made anywhere else, such as the dashboard, webhooks or
+                other processes, stay invisible until the directory is cleared.
 
         Example:
             >>> service = StripeService(
@@ -41,8 +126,110 @@ class StripeService:
         self.secret_key = secret_key
         self.publishable_key = publishable_key
 
-        # Set the Stripe API key for all operations
-        stripe.api_key = self.secret_key
+        # Per-request options passed to every Stripe call. The API key is sent
+        # per call rather than set on the global stripe.api_key, so services
+        # with different keys can run side by side in one process. The SDK
+        # retries with backoff and attaches idempotency keys to retried POSTs;
+        # its default HTTP client already keeps a pooled keep-alive session.
+        self._request_options = {
+            "api_key": self.secret_key,
+            "max_network_retries": max_network_retries,
+        }
+
+        # Opt-in cache of get_customer responses to skip repeated round-trips
+        self._customer_cache = TTLCache(maxsize=customer_cache_size, ttl=customer_cache_ttl)
+
+        # Optional on-disk cache of read responses for dev/test replay
+        self._disk_cache = None
+        if cache_dir is not None:
+            try:
+                import diskcache
+            except ImportError as e:
+                raise ImportError(
+                    "cache_dir requires the 'diskcache' package. Install it with "
+                    "the 'disk-cache' extra: pamfilico-python-stripe-sdk[disk-cache]"
+                ) from e
+            self._disk_cache = diskcache.Cache(cache_dir, tag_index=True)
+
+        # Namespace disk cache keys per secret key so services for different
+        # accounts sharing a cache_dir never read each other's customers
+        self._disk_cache_namespace = hashlib.sha256(secret_key.encode()).hexdigest()[:16]
+
+        # Tag for email and list lookups, which any customer write can make stale
+        self._disk_cache_list_tag = f"{self._disk_cache_namespace}:lists"
+
+    def _disk_cache_get(self, key: Hashable, model: Type[_ResponseT]) -> Optional[_ResponseT]:
+        """Return a response from the on-disk cache, or None if absent or disabled."""
+        if self._disk_cache is None:
+            return None
+        data = self._disk_cache.get((self._disk_cache_namespace, key))
+        if data is None:
+            return None
+        return model.model_validate(data)
+
+    def _disk_cache_set(
+        self,
+        key: Hashable,
+        response: BaseModel,
+        tag: Optional[str] = None
+    ) -> None:
+        """Store a response in the on-disk cache if it is enabled.
+
+        Only the JSON-compatible dump is stored, never SDK objects, so nothing
+        that carries credentials is written to disk. Entries stored with a tag
+        can be evicted together.
+        """
+        if self._disk_cache is not None:
+            self._disk_cache.set(
+                (self._disk_cache_namespace, key),
+                response.model_dump(mode="json"),
+                tag=tag
+            )
+
+    def _disk_cache_delete(self, key: Hashable) -> None:
+        """Remove a response from the on-disk cache if it is enabled."""
+        if self._disk_cache is not None:
+            self._disk_cache.delete((self._disk_cache_namespace, key))
+
+    async def _run_cache_io(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a cache helper from async code without blocking the event loop.
+
+        The in-memory cache is cheap and thread-safe, but diskcache does
+        blocking file I/O, so calls are moved to a worker thread when it is on.
+        """
+        if self._disk_cache is None:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    def _cached_customer(self, customer_id: str) -> Optional[CustomerResponse]:
+        """Return a cached get_customer response from memory or disk, or None."""
+        cached = self._customer_cache.get(customer_id)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        response = self._disk_cache_get(("get_customer", customer_id), CustomerResponse)
+        if response is not None:
+            self._customer_cache.set(customer_id, response.model_copy(deep=True))
+
+        return response
+
+    def _store_customer(self, customer_id: str, response: CustomerResponse) -> None:
+        """Cache a get_customer response in memory and on disk."""
+        self._customer_cache.set(customer_id, response.model_copy(deep=True))
+        self._disk_cache_set(("get_customer", customer_id), response)
+
+    def _invalidate_after_write(self, customer_id: Optional[str] = None) -> None:
+        """Drop cached responses a customer create or update can make stale.
+
+        Email and list lookups are always evicted, since any write can change
+        their results; the customer's own entry is dropped when an ID is given.
+        """
+        if customer_id is not None:
+            self._customer_cache.pop(customer_id, None)
+            self._disk_cache_delete(("get_customer", customer_id))
+
+        if self._disk_cache is not None:
+            self._disk_cache.evict(self._disk_cache_list_tag)
 
     def create_customer(
         self,
@@ -75,40 +262,24 @@ class StripeService:
             'customer@example.com'
         """
         # Prepare Stripe customer data from validated input
-        customer_data = {}
-        if data.email:
-            customer_data["email"] = data.email
-        if data.name:
-            customer_data["name"] = data.name
-        if data.phone:
-            customer_data["phone"] = data.phone
-        if data.description:
-            customer_data["description"] = data.description
-        if data.metadata:
-            customer_data["metadata"] = data.metadata
+        customer_data = data.model_dump(exclude_none=True, exclude_defaults=True)
 
         # Create Stripe customer
-        stripe_customer = stripe.Customer.create(**customer_data)
+        stripe_customer = stripe.Customer.create(**self._request_options, **customer_data)
+        self._invalidate_after_write()
 
         # Serialize response
-        customer_data = CustomerData(
-            id=stripe_customer.id,
-            email=stripe_customer.email,
-            name=stripe_customer.name,
-            phone=stripe_customer.phone,
-            description=stripe_customer.description,
-            balance=stripe_customer.balance,
-            currency=stripe_customer.currency,
-            delinquent=stripe_customer.delinquent,
-            created=stripe_customer.created,
-            metadata=dict(stripe_customer.metadata) if stripe_customer.metadata else {}
-        )
+        customer_data = _serialize_customer(stripe_customer)
 
-        return CustomerResponse(data=customer_data, meta={})
+        return CustomerResponse(data=customer_data)
 
     def get_customer(self, customer_id: str) -> CustomerResponse:
         """Get a single Stripe customer by ID.
 
+        When customer_cache_size is set, responses are cached in-process for
+        customer_cache_ttl seconds and each caller gets its own copy;
+        update_customer invalidates the cached entry.
+
         Args:
             customer_id: The Stripe customer ID (cus_...)
 
@@ -125,22 +296,18 @@ class StripeService:
             >>> print(customer.name)
             'John Doe'
         """
-        customer = stripe.Customer.retrieve(customer_id)
-
-        customer_data = CustomerData(
-            id=customer.id,
-            email=customer.email,
-            name=customer.name,
-            phone=customer.phone,
-            created=customer.created,
-            balance=customer.balance,
-            currency=customer.currency,
-            delinquent=customer.delinquent,
-            description=customer.description,
-            metadata=dict(customer.metadata) if customer.metadata else {}
-        )
+        cached = self._cached_customer(customer_id)
+        if cached is not None:
+            return cached
+
+        customer = stripe.Customer.retrieve(customer_id, **self._request_options)
+
+        customer_data = _serialize_customer(customer)
 
-        return CustomerResponse(data=customer_data, meta={})
+        response = CustomerResponse(data=customer_data)
+        self._store_customer(customer_id, response)
+
+        return response
 
     def update_customer(
         self,
@@ -171,36 +338,18 @@ class StripeService:
             'newemail@example.com'
         """
         # Prepare update data from validated input
-        update_data = {}
-        if data.email is not None:
-            update_data["email"] = data.email
-        if data.name is not None:
-            update_data["name"] = data.name
-        if data.phone is not None:
-            update_data["phone"] = data.phone
-        if data.description is not None:
-            update_data["description"] = data.description
-        if data.metadata is not None:
-            update_data["metadata"] = data.metadata
+        update_data = data.model_dump(exclude_none=True)
 
         # Update Stripe customer
-        stripe_customer = stripe.Customer.modify(customer_id, **update_data)
+        stripe_customer = stripe.Customer.modify(
+            customer_id, **self._request_options, **update_data
+        )
+        self._invalidate_after_write(customer_id)
 
         # Serialize response
-        customer_data = CustomerData(
-            id=stripe_customer.id,
-            email=stripe_customer.email,
-            name=stripe_customer.name,
-            phone=stripe_customer.phone,
-            description=stripe_customer.description,
-            balance=stripe_customer.balance,
-            currency=stripe_customer.currency,
-            delinquent=stripe_customer.delinquent,
-            created=stripe_customer.created,
-            metadata=dict(stripe_customer.metadata) if stripe_customer.metadata else {}
-        )
+        customer_data = _serialize_customer(stripe_customer)
 
-        return CustomerResponse(data=customer_data, meta={})
+        return CustomerResponse(data=customer_data)
 
     def get_customer_by_email(self, email: str) -> CustomerListResponse:
         """Get Stripe customers by email address.
@@ -216,6 +365,9 @@ class StripeService:
                 - data: List of CustomerData models matching the email
                 - meta: CustomerListMeta with pagination info (has_more, total_count, note)
 
+        Raises:
+            StripeValidationError: If email is not a valid email address
+
         Example:
             >>> result = service.get_customer_by_email("customer@example.com")
             >>> print(result.meta.note)
@@ -225,36 +377,26 @@ class StripeService:
             ...     print(customer.id)
             ...     'cus_abc123...'
         """
-        # Fetch customers from Stripe filtered by email
-        customers_response = stripe.Customer.list(email=email)
+        if not is_valid_email(email):
+            raise StripeValidationError(message="Invalid email address")
 
-        # Serialize customer data
-        customers_data = []
-        for customer in customers_response.data:
-            customers_data.append(CustomerData(
-                id=customer.id,
-                email=customer.email,
-                name=customer.name,
-                phone=customer.phone,
-                created=customer.created,
-                balance=customer.balance,
-                currency=customer.currency,
-                delinquent=customer.delinquent,
-                description=customer.description,
-                metadata=dict(customer.metadata) if customer.metadata else {}
-            ))
+        cache_key = ("get_customer_by_email", email)
+        cached = self._disk_cache_get(cache_key, CustomerListResponse)
+        if cached is not None:
+            return cached
 
-        # Generate note message
-        count = len(customers_data)
-        note = f"Found {count} customer" if count == 1 else f"Found {count} customers"
+        # Fetch customers from Stripe filtered by email
+        customers_response = stripe.Customer.list(email=email, **self._request_options)
 
-        meta = CustomerListMeta(
+        # Serialize customer data
+        response = _serialize_customer_list(
+            customers_response.data,
             has_more=customers_response.has_more,
-            total_count=count,
-            note=note
+            with_note=True
         )
+        self._disk_cache_set(cache_key, response, self._disk_cache_list_tag)
 
-        return CustomerListResponse(data=customers_data, meta=meta)
+        return response
 
     def list_customers(
         self,
@@ -302,43 +444,380 @@ class StripeService:
             if starting_after:
                 params["starting_after"] = starting_after
 
+            cache_key = ("list_customers", tuple(sorted(params.items())))
+            cached = self._disk_cache_get(cache_key, CustomerListResponse)
+            if cached is not None:
+                return cached
+
             # Fetch customers from Stripe
-            customers_response = stripe.Customer.list(**params)
+            customers_response = stripe.Customer.list(**self._request_options, **params)
 
             # Serialize customer data
-            customers_data = []
-            for customer in customers_response.data:
-                customers_data.append(CustomerData(
-                    id=customer.id,
-                    email=customer.email,
-                    name=customer.name,
-                    created=customer.created,
-                    balance=customer.balance,
-                    currency=customer.currency,
-                    delinquent=customer.delinquent,
-                    description=customer.description,
-                    metadata=dict(customer.metadata) if customer.metadata else {}
-                ))
-
-            meta = CustomerListMeta(
-                has_more=customers_response.has_more,
-                total_count=len(customers_data)
+            response = _serialize_customer_list(
+                customers_response.data,
+                has_more=customers_response.has_more
             )
+            self._disk_cache_set(cache_key, response, self._disk_cache_list_tag)
+
+            return response
+
+        except stripe.error.StripeError as e:
+            raise _translate_stripe_error(e)
+
+    def iter_customers(
+        self,
+        page_size: int = 100,
+        **filters: Any
+    ) -> Iterator[CustomerData]:
+        """Iterate over all Stripe customers, fetching one page at a time.
 
-            return CustomerListResponse(data=customers_data, meta=meta)
+        Unlike list_customers, pagination is handled automatically and only
+        the current page is held in memory, so large accounts can be walked
+        without materializing every customer.
 
-        except stripe.error.AuthenticationError as e:
-            raise StripeAuthenticationError(
-                message=f"Stripe authentication failed: {str(e)}",
-                original_error=e
+        Args:
+            page_size: Number of customers to fetch per request (default: 100, max: 100)
+            **filters: Additional Stripe list filters (e.g. email, created,
+                starting_after). The page size is set with page_size, not limit.
+
+        Yields:
+            CustomerData: One model per customer, in Stripe's list order
+
+        Raises:
+            StripeValidationError: If page_size is less than 1 or limit is
+                passed as a filter (raised on the call, before iteration)
+            StripeAuthenticationError: If Stripe API authentication fails
+            StripeInvalidRequestError: If request parameters are invalid
+            StripeAPIError: If Stripe API returns an error
+
+        Example:
+            >>> for customer in service.iter_customers(email="customer@example.com"):
+            ...     print(customer.id)
+            'cus_abc123...'
+        """
+        if page_size < 1:
+            raise StripeValidationError(
+                message=f"page_size must be at least 1, got {page_size}"
             )
-        except stripe.error.InvalidRequestError as e:
-            raise StripeInvalidRequestError(
-                message=f"Invalid request to Stripe API: {str(e)}",
-                original_error=e
+        if "limit" in filters:
+            raise StripeValidationError(
+                message="Use page_size instead of limit to set the page size"
             )
+
+        params = {"limit": min(page_size, 100), **filters}
+        return self._iter_customers(params)
+
+    def _iter_customers(self, params: Dict[str, Any]) -> Iterator[CustomerData]:
+        """Yield customers for validated list params across all pages."""
+        try:
+            customers_response = stripe.Customer.list(**self._request_options, **params)
+
+            for customer in customers_response.auto_paging_iter():
+                yield _serialize_customer(customer)
+
         except stripe.error.StripeError as e:
-            raise StripeAPIError(
-                message=f"Stripe API error: {str(e)}",
-                original_error=e
+            raise _translate_stripe_error(e)
+
+    def bulk_get_customers(
+        self,
+        customer_ids: List[str],
+        max_workers: int = 16
+    ) -> CustomerListResponse:
+        """Get several Stripe customers by ID using a thread pool.
+
+        Retrievals are I/O-bound, so running them on worker threads overlaps
+        the Stripe round-trips instead of paying for each one in turn.
+
+        Args:
+            customer_ids: Stripe customer IDs (cus_...) to fetch
+            max_workers: Maximum number of concurrent requests (default: 16)
+
+        Returns:
+            CustomerListResponse: Pydantic model containing:
+                - data: List of CustomerData models, in the order of customer_ids
+                - meta: CustomerListMeta with has_more=False and total_count
+
+        Raises:
+            StripeValidationError: If max_workers is less than 1
+
+        Example:
+            >>> result = service.bulk_get_customers(["cus_123abc", "cus_456def"])
+            >>> print([customer.id for customer in result.data])
+            ['cus_123abc', 'cus_456def']
+        """
+        if max_workers < 1:
+            raise StripeValidationError(
+                message=f"max_workers must be at least 1, got {max_workers}"
             )
+
+        # Retrieve customers on worker threads, preserving input order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            customers = list(executor.map(
+                lambda customer_id: stripe.Customer.retrieve(
+                    customer_id, **self._request_options
+                ),
+                customer_ids
+            ))
+
+        return _serialize_customer_list(customers)
+
+    async def create_customer_async(
+        self,
+        data: CustomerCreateInput
+    ) -> CustomerResponse:
+        """Create a new Stripe customer without blocking the event loop.
+
+        Async counterpart of :meth:`create_customer`.
+
+        Args:
+            data: CustomerCreateInput model with validated customer data
+
+        Returns:
+            CustomerResponse: Same shape as :meth:`create_customer`
+
+        Example:
+            >>> result = await service.create_customer_async(input_data)
+            >>> print(result.data.id)
+            'cus_abc123...'
+        """
+        # Prepare Stripe customer data from validated input
+        customer_data = data.model_dump(exclude_none=True, exclude_defaults=True)
+
+        # Create Stripe customer
+        stripe_customer = await stripe.Customer.create_async(**self._request_options, **customer_data)
+        await self._run_cache_io(self._invalidate_after_write)
+
+        # Serialize response
+        customer_data = _serialize_customer(stripe_customer)
+
+        return CustomerResponse(data=customer_data)
+
+    async def get_customer_async(self, customer_id: str) -> CustomerResponse:
+        """Get a single Stripe customer by ID without blocking the event loop.
+
+        Async counterpart of :meth:`get_customer`.
+
+        Args:
+            customer_id: The Stripe customer ID (cus_...)
+
+        Returns:
+            CustomerResponse: Same shape as :meth:`get_customer`
+
+        Example:
+            >>> result = await service.get_customer_async("cus_123abc")
+            >>> print(result.data.email)
+            'customer@example.com'
+        """
+        cached = await self._run_cache_io(self._cached_customer, customer_id)
+        if cached is not None:
+            return cached
+
+        customer = await stripe.Customer.retrieve_async(customer_id, **self._request_options)
+
+        customer_data = _serialize_customer(customer)
+
+        response = CustomerResponse(data=customer_data)
+        await self._run_cache_io(self._store_customer, customer_id, response)
+
+        return response
+
+    async def update_customer_async(
+        self,
+        customer_id: str,
+        data: CustomerUpdateInput
+    ) -> CustomerResponse:
+        """Update an existing Stripe customer without blocking the event loop.
+
+        Async counterpart of :meth:`update_customer`.
+
+        Args:
+            customer_id: The Stripe customer ID (cus_...)
+            data: CustomerUpdateInput model with validated update data
+
+        Returns:
+            CustomerResponse: Same shape as :meth:`update_customer`
+
+        Example:
+            >>> result = await service.update_customer_async("cus_123abc", update_data)
+            >>> print(result.data.email)
+            'newemail@example.com'
+        """
+        # Prepare update data from validated input
+        update_data = data.model_dump(exclude_none=True)
+
+        # Update Stripe customer
+        stripe_customer = await stripe.Customer.modify_async(
+            customer_id, **self._request_options, **update_data
+        )
+        await self._run_cache_io(self._invalidate_after_write, customer_id)
+
+        # Serialize response
+        customer_data = _serialize_customer(stripe_customer)
+
+        return CustomerResponse(data=customer_data)
+
+    async def get_customer_by_email_async(self, email: str) -> CustomerListResponse:
+        """Get Stripe customers by email address without blocking the event loop.
+
+        Async counterpart of :meth:`get_customer_by_email`.
+
+        Args:
+            email: Customer email address (case-sensitive)
+
+        Returns:
+            CustomerListResponse: Same shape as :meth:`get_customer_by_email`
+
+        Raises:
+            StripeValidationError: If email is not a valid email address
+
+        Example:
+            >>> result = await service.get_customer_by_email_async("customer@example.com")
+            >>> print(result.meta.note)
+            'Found 1 customer'
+        """
+        if not is_valid_email(email):
+            raise StripeValidationError(message="Invalid email address")
+
+        cache_key = ("get_customer_by_email", email)
+        cached = await self._run_cache_io(
+            self._disk_cache_get, cache_key, CustomerListResponse
+        )
+        if cached is not None:
+            return cached
+
+        # Fetch customers from Stripe filtered by email
+        customers_response = await stripe.Customer.list_async(email=email, **self._request_options)
+
+        # Serialize customer data
+        response = _serialize_customer_list(
+            customers_response.data,
+            has_more=customers_response.has_more,
+            with_note=True
+        )
+        await self._run_cache_io(
+            self._disk_cache_set, cache_key, response, self._disk_cache_list_tag
+        )
+
+        return response
+
+    async def list_customers_async(
+        self,
+        limit: int = 100,
+        starting_after: Optional[str] = None
+    ) -> CustomerListResponse:
+        """List Stripe customers with pagination without blocking the event loop.
+
+        Async counterpart of :meth:`list_customers`.
+
+        Args:
+            limit: Number of customers to fetch per page (default: 100, max: 100)
+            starting_after: Stripe customer ID to use as cursor for pagination
+
+        Returns:
+            CustomerListResponse: Same shape as :meth:`list_customers`
+
+        Raises:
+            StripeAuthenticationError: If Stripe API authentication fails
+            StripeInvalidRequestError: If request parameters are invalid
+            StripeAPIError: If Stripe API returns an error
+
+        Example:
+            >>> result = await service.list_customers_async(limit=50)
+            >>> print(f"Found {result.meta.total_count} customers")
+            Found 50 customers
+        """
+        try:
+            # Validate and cap limit
+            limit = min(limit, 100)
+
+            # Build Stripe API request parameters
+            params = {"limit": limit}
+            if starting_after:
+                params["starting_after"] = starting_after
+
+            cache_key = ("list_customers", tuple(sorted(params.items())))
+            cached = await self._run_cache_io(
+                self._disk_cache_get, cache_key, CustomerListResponse
+            )
+            if cached is not None:
+                return cached
+
+            # Fetch customers from Stripe
+            customers_response = await stripe.Customer.list_async(**self._request_options, **params)
+
+            # Serialize customer data
+            response = _serialize_customer_list(
+                customers_response.data,
+                has_more=customers_response.has_more
+            )
+            await self._run_cache_io(
+                self._disk_cache_set, cache_key, response, self._disk_cache_list_tag
+            )
+
+            return response
+
+        except stripe.error.StripeError as e:
+            raise _translate_stripe_error(e)
+
+    async def get_customers_by_ids_async(
+        self,
+        customer_ids: List[str],
+        max_concurrency: Optional[int] = None
+    ) -> CustomerListResponse:
+        """Get several Stripe customers by ID with concurrent requests.
+
+        Each customer is retrieved with its own request. By default all of
+        them are dispatched at once, so the total wait is roughly one Stripe
+        round-trip instead of one per customer. For large ID lists, set
+        max_concurrency to cap the requests in flight and stay within Stripe
+        rate limits.
+
+        Args:
+            customer_ids: Stripe customer IDs (cus_...) to fetch
+            max_concurrency: Maximum number of requests in flight
+                (default: None, unbounded)
+
+        Returns:
+            CustomerListResponse: Pydantic model containing:
+                - data: List of CustomerData models, in the order of customer_ids
+                - meta: CustomerListMeta with has_more=False and total_count
+
+        Raises:
+            StripeValidationError: If max_concurrency is less than 1
+
+        Example:
+            >>> result = await service.get_customers_by_ids_async(
+            ...     ["cus_123abc", "cus_456def"]
+            ... )
+            >>> print([customer.id for customer in result.data])
+            ['cus_123abc', 'cus_456def']
+            >>>
+            >>> # Cap concurrency for large ID lists
+            >>> result = await service.get_customers_by_ids_async(
+            ...     customer_ids,
+            ...     max_concurrency=10
+            ... )
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise StripeValidationError(
+                message=f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def fetch(customer_id: str) -> stripe.Customer:
+            if semaphore is None:
+                return await stripe.Customer.retrieve_async(
+                    customer_id, **self._request_options
+                )
+            async with semaphore:
+                return await stripe.Customer.retrieve_async(
+                    customer_id, **self._request_options
+                )
+
+        # Retrieve all customers concurrently, preserving input order
+        customers = await asyncio.gather(
+            *(fetch(customer_id) for customer_id in customer_ids)
+        )
+
+        return _serialize_customer_list(customers)